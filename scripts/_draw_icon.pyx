@@ -0,0 +1,95 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled per-pixel renderer for generate-icon.py.
+
+Same algorithm as draw_icon_loop in generate-icon.py, built on demand via
+pyximport. The eye geometry is passed in by the caller, so the design is
+only defined in generate-icon.py.
+"""
+
+from libc.math cimport fabs, fmax, sqrt
+
+
+cdef void draw(
+    int size, const double[:, ::1] sparkle_lut, double[:, ::1] alpha_out,
+    double design_size, double eye_cx, double eye_cy,
+    double eye_width, double eye_height,
+    double arc_r, double upper_cy, double lower_cy, double sparkle_limit,
+) noexcept nogil:
+    cdef double scale = size / design_size
+    cdef double inv_scale = 1.0 / scale
+    cdef double stroke = 2.0 * scale
+    cdef double outer_stroke = 1.2 * scale
+
+    cdef double reject_x = eye_width + 2
+    cdef double reject_y = eye_height + outer_stroke
+    cdef double sparkle_limit_sq = sparkle_limit * sparkle_limit
+
+    cdef double arc_r_sq = arc_r * arc_r
+    cdef double stroke_r = arc_r - stroke * inv_scale
+    cdef double stroke_sq = stroke_r * stroke_r
+    cdef double outer_r = arc_r + outer_stroke
+    cdef double outer_sq = outer_r * outer_r
+
+    cdef int py, px, lut_y
+    cdef double dx, dy, rel_x, rel_y, rel_x_sq, rel_y_sq
+    cdef double dy_upper, dy_lower, dy_upper_sq, dy_lower_sq
+    cdef double d2, alpha, edge_dist, out_dist
+
+    for py in range(size):
+        # Everything that depends only on the row
+        dy = py * inv_scale
+        rel_y = dy - eye_cy
+        if fabs(rel_y) >= reject_y:
+            continue
+        rel_y_sq = rel_y * rel_y
+        dy_upper = dy - upper_cy
+        dy_lower = dy - lower_cy
+        dy_upper_sq = dy_upper * dy_upper
+        dy_lower_sq = dy_lower * dy_lower
+        lut_y = <int>dy
+
+        for px in range(size):
+            dx = px * inv_scale
+            rel_x = dx - eye_cx
+            if fabs(rel_x) >= reject_x:
+                continue
+            rel_x_sq = rel_x * rel_x
+
+            alpha = 0.0
+
+            d2 = rel_x_sq + fmax(dy_upper_sq, dy_lower_sq)
+
+            if d2 < arc_r_sq:
+                # Inside the eye
+                if rel_x_sq + rel_y_sq < sparkle_limit_sq:
+                    alpha = sparkle_lut[lut_y, <int>dx] * 0.9
+
+                if d2 > stroke_sq:
+                    edge_dist = (arc_r - sqrt(d2)) * scale
+                    if edge_dist < stroke:
+                        alpha = fmax(alpha, (1.0 - edge_dist / stroke) * 255)
+            elif d2 < outer_sq:
+                # Outside — anti-aliased outer edge
+                out_dist = sqrt(d2) - arc_r
+                if out_dist < outer_stroke:
+                    alpha = fmax(
+                        alpha, (1.0 - out_dist / outer_stroke) * 255,
+                    )
+
+            alpha_out[py, px] = alpha
+
+
+def draw_icon_loop(
+    int size, const double[:, ::1] sparkle_lut, double[:, ::1] alpha_out,
+    double design_size, double eye_cx, double eye_cy,
+    double eye_width, double eye_height,
+    double arc_r, double upper_cy, double lower_cy, double sparkle_limit,
+):
+    """Write the 0-255 icon alpha into a zeroed (size, size) float array."""
+    with nogil:
+        draw(
+            size, sparkle_lut, alpha_out,
+            design_size, eye_cx, eye_cy, eye_width, eye_height,
+            arc_r, upper_cy, lower_cy, sparkle_limit,
+        )
@@ -13,38 +13,80 @@ macOS template image requirements:
   - Black pixels on transparent background
   - Named with "Template" suffix
   - macOS automatically applies theme-appropriate tinting
+
+Requires NumPy. Pillow is used for PNG decoding when installed. Icons are
+rendered with NumPy by default; --backend numba or --backend cython selects
+a compiled per-pixel renderer instead (useful only for much larger sizes).
+--check-backends verifies that all available renderers agree exactly.
 """
 
+import argparse
+import functools
+import math
 import struct
+import sys
 import zlib
-import math
 import os
+from typing import Callable, Optional
 
+import numpy as np
 
-def create_png(width: int, height: int, pixels: list[int]) -> bytes:
-    """Create a PNG file from RGBA pixel data."""
-    def chunk(chunk_type: bytes, data: bytes) -> bytes:
-        c = chunk_type + data
-        crc = struct.pack('>I', zlib.crc32(c) & 0xffffffff)
-        return struct.pack('>I', len(data)) + c + crc
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; fall back to the built-in decoder
+    Image = None
 
-    raw = b''
-    for y in range(height):
-        raw += b'\x00'
-        for x in range(width):
-            idx = (y * width + x) * 4
-            raw += bytes(pixels[idx:idx + 4])
+
+def create_png(pixels: np.ndarray) -> bytes:
+    """Create a PNG file from an (height, width, 4) RGBA pixel array."""
+    def chunk(chunk_type: bytes, data: bytes) -> bytes:
+        # CRC covers type + data; continue it over data without joining them
+        crc = zlib.crc32(data, zlib.crc32(chunk_type))
+        return (struct.pack('>I', len(data)) + chunk_type + data
+                + struct.pack('>I', crc))
+
+    def deflate(data: bytes, strategy: int) -> bytes:
+        co = zlib.compressobj(9, zlib.DEFLATED, 15, 8, strategy)
+        return co.compress(data) + co.flush()
+
+    height, width = pixels.shape[:2]
+    # Each scanline is filter type 0 (None) followed by its RGBA bytes
+    raw = bytearray(height * (1 + width * 4))
+    scanlines = np.frombuffer(raw, np.uint8).reshape(height, 1 + width * 4)
+    scanlines[:, 1:] = pixels.reshape(height, width * 4)
+
+    # Neither deflate strategy wins on both icon sizes; keep the smaller
+    idat = min(
+        (deflate(raw, strategy)
+         for strategy in (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED)),
+        key=len,
+    )
 
     sig = b'\x89PNG\r\n\x1a\n'
     ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
     return (sig
             + chunk(b'IHDR', ihdr)
-            + chunk(b'IDAT', zlib.compress(raw, 9))
+            + chunk(b'IDAT', idat)
             + chunk(b'IEND', b''))
 
 
-def decode_png(filepath: str) -> tuple[int, int, list[int]]:
-    """Decode a PNG file into RGBA pixel data (pure Python)."""
+def decode_png(filepath: str) -> tuple[int, int, np.ndarray]:
+    """
+    Decode the alpha plane of a PNG file into an (height, width) array.
+
+    Only alpha is used for drawing, so the color channels are dropped.
+    Transparency from a tRNS chunk counts as alpha; images with neither
+    fall back to their luminance.
+    """
+    if Image is not None:
+        with Image.open(filepath) as im:
+            if 'A' in im.getbands() or 'transparency' in im.info:
+                plane = im.convert('RGBA').getchannel('A')
+            else:
+                plane = im.convert('L')
+        return plane.width, plane.height, np.asarray(plane)
+
+    # Pure Python fallback
     with open(filepath, 'rb') as f:
         data = f.read()
 
@@ -56,6 +98,7 @@ def decode_png(filepath: str) -> tuple[int, int, list[int]]:
     chunks: dict[bytes, list[bytes]] = {}
     width = height = bit_depth = color_type = 0
     idat_data = b''
+    trns_data = None
 
     while pos < len(data):
         length = struct.unpack('>I', data[pos:pos + 4])[0]
@@ -69,6 +112,8 @@ def decode_png(filepath: str) -> tuple[int, int, list[int]]:
             )
         elif chunk_type == b'IDAT':
             idat_data += chunk_data
+        elif chunk_type == b'tRNS':
+            trns_data = chunk_data
         elif chunk_type == b'IEND':
             break
 
@@ -84,228 +129,437 @@ def decode_png(filepath: str) -> tuple[int, int, list[int]]:
         bpp = 2
     elif color_type == 0:  # Grayscale
         bpp = 1
+    elif color_type == 3:  # Palette
+        raise ValueError('Palette PNGs need Pillow to decode')
     else:
         raise ValueError(f'Unsupported color type: {color_type}')
 
     stride = width * bpp
 
     # Reconstruct scanlines with filter
-    pixels = [0] * (width * height * 4)
-    prev_row = [0] * stride
-    raw_pos = 0
+    scanlines = np.frombuffer(raw, np.uint8).reshape(height, 1 + stride)
+    rows = np.empty((height, stride), np.uint8)
+    prev_row = np.zeros(stride, np.uint8)
 
     for y in range(height):
-        filter_type = raw[raw_pos]
-        raw_pos += 1
-        row = list(raw[raw_pos:raw_pos + stride])
-        raw_pos += stride
-
-        # Apply PNG filter
-        for i in range(stride):
-            a = row[i - bpp] if i >= bpp else 0
-            b = prev_row[i]
-            c = prev_row[i - bpp] if i >= bpp else 0
-
-            if filter_type == 0:  # None
-                pass
-            elif filter_type == 1:  # Sub
-                row[i] = (row[i] + a) & 0xFF
-            elif filter_type == 2:  # Up
-                row[i] = (row[i] + b) & 0xFF
-            elif filter_type == 3:  # Average
-                row[i] = (row[i] + (a + b) // 2) & 0xFF
-            elif filter_type == 4:  # Paeth
-                p = a + b - c
-                pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
-                if pa <= pb and pa <= pc:
-                    pr = a
-                elif pb <= pc:
-                    pr = b
-                else:
-                    pr = c
-                row[i] = (row[i] + pr) & 0xFF
-
-        # Convert to RGBA
-        for x in range(width):
-            dst = (y * width + x) * 4
-            src = x * bpp
-            if color_type == 6:  # RGBA
-                pixels[dst] = row[src]
-                pixels[dst + 1] = row[src + 1]
-                pixels[dst + 2] = row[src + 2]
-                pixels[dst + 3] = row[src + 3]
-            elif color_type == 2:  # RGB
-                pixels[dst] = row[src]
-                pixels[dst + 1] = row[src + 1]
-                pixels[dst + 2] = row[src + 2]
-                pixels[dst + 3] = 255
-            elif color_type == 4:  # GA
-                pixels[dst] = row[src]
-                pixels[dst + 1] = row[src]
-                pixels[dst + 2] = row[src]
-                pixels[dst + 3] = row[src + 1]
-            elif color_type == 0:  # G
-                pixels[dst] = row[src]
-                pixels[dst + 1] = row[src]
-                pixels[dst + 2] = row[src]
-                pixels[dst + 3] = 255
-
+        filter_type = scanlines[y, 0]
+        row = scanlines[y, 1:].copy()
+
+        # Apply PNG filter (uint8 arithmetic wraps modulo 256)
+        if filter_type == 1:  # Sub: running sum along each channel
+            lanes = row.reshape(width, bpp)
+            np.add.accumulate(lanes, axis=0, dtype=np.uint8, out=lanes)
+        elif filter_type == 2:  # Up
+            row += prev_row
+        elif filter_type == 3:  # Average: needs the reconstructed left byte
+            cur = row.tolist()
+            prev = prev_row.tolist()
+            for i in range(stride):
+                a = cur[i - bpp] if i >= bpp else 0
+                cur[i] = (cur[i] + (a + prev[i]) // 2) & 0xFF
+            row = np.array(cur, np.uint8)
+        elif filter_type == 4:  # Paeth
+            # Terms that only involve the previous row are computed for the
+            # whole row up front; only the left neighbour is resolved per byte
+            up = prev_row.astype(np.int16)
+            up_left = np.concatenate([np.zeros(bpp, np.int16), up[:-bpp]])
+            up_diff = up - up_left
+            pa_row = np.abs(up_diff).tolist()  # |p - a| == |b - c|
+            diff_row = up_diff.tolist()
+            b_row = prev_row.tolist()
+            c_row = up_left.tolist()
+            cur = row.tolist()
+            for i in range(stride):
+                a = cur[i - bpp] if i >= bpp else 0
+                b = b_row[i]
+                c = c_row[i]
+                pa = pa_row[i]
+                pb = abs(a - c)                 # |p - b|
+                pc = abs(a - c + diff_row[i])   # |p - c|
+                pr = a if pa <= pb and pa <= pc else (b if pb <= pc else c)
+                cur[i] = (cur[i] + pr) & 0xFF
+            row = np.array(cur, np.uint8)
+
+        rows[y] = row
         prev_row = row
 
-    return width, height, pixels
-
+    # Extract alpha (or luminance when there is none)
+    samples = rows.reshape(height, width, bpp)
+    if color_type == 6:  # RGBA
+        alpha = samples[..., 3]
+    elif color_type == 4:  # GA
+        alpha = samples[..., 1]
+    elif color_type == 2:  # RGB: ITU-R 601-2 luma, rounded as Pillow does
+        rgb = samples.astype(np.uint32)
+        alpha = ((rgb[..., 0] * 19595 + rgb[..., 1] * 38470
+                  + rgb[..., 2] * 7471 + 0x8000) >> 16).astype(np.uint8)
+    else:  # G
+        alpha = samples[..., 0]
+
+    # tRNS on G/RGB names one transparent color; everything else is opaque
+    if trns_data is not None and color_type in (0, 2):
+        key = struct.unpack(f'>{bpp}H', trns_data[:2 * bpp])
+        transparent = np.all(samples == key, axis=-1)
+        alpha = np.where(transparent, 0, 255).astype(np.uint8)
+
+    return width, height, alpha
+
+
+def sample_image_grid(
+    src_alpha: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+) -> np.ndarray:
+    """Bilinear sample of alpha from source image at arrays of coordinates.
+
+    Returns 0-255 alphas; coordinates outside the source sample as 0.
+    """
+    src_alpha = src_alpha.astype(np.float32)  # uint8 differences would wrap
+    src_h, src_w = src_alpha.shape
+    valid = (xs >= 0) & (xs < src_w) & (ys >= 0) & (ys < src_h)
+
+    x0 = np.floor(xs).astype(int)
+    y0 = np.floor(ys).astype(int)
+    fx = xs - x0
+    fy = ys - y0
+    x1 = np.clip(x0 + 1, 0, src_w - 1)
+    y1 = np.clip(y0 + 1, 0, src_h - 1)
+    x0 = np.clip(x0, 0, src_w - 1)
+    y0 = np.clip(y0, 0, src_h - 1)
+
+    a00 = src_alpha[y0, x0]
+    a10 = src_alpha[y0, x1]
+    a01 = src_alpha[y1, x0]
+    a11 = src_alpha[y1, x1]
 
-def sample_image(
-    src_pixels: list[int], src_w: int, src_h: int,
-    x: float, y: float,
-) -> int:
-    """Bilinear sample of alpha from source image. Returns 0-255 alpha."""
-    # Map to source coordinates
-    if x < 0 or x >= src_w or y < 0 or y >= src_h:
-        return 0
+    top = a00 + (a10 - a00) * fx
+    bot = a01 + (a11 - a01) * fx
+    return np.where(valid, np.trunc(top + (bot - top) * fy), 0.0)
 
-    x0 = int(x)
-    y0 = int(y)
-    x1 = min(x0 + 1, src_w - 1)
-    y1 = min(y0 + 1, src_h - 1)
-    fx = x - x0
-    fy = y - y0
 
-    def get_alpha(px: int, py: int) -> int:
-        idx = (py * src_w + px) * 4
-        return src_pixels[idx + 3]
+DESIGN_SIZE = 32  # Geometry below is in this pixel space
 
-    a00 = get_alpha(x0, y0)
-    a10 = get_alpha(x1, y0)
-    a01 = get_alpha(x0, y1)
-    a11 = get_alpha(x1, y1)
+# --- Eye shape parameters (in 32px design space) ---
+EYE_CX = 16.0
+EYE_CY = 16.0
+EYE_WIDTH = 14.0    # Half-width of the eye
+EYE_HEIGHT = 10.0   # Half-height — tall, rounded eye
 
-    top = a00 + (a10 - a00) * fx
-    bot = a01 + (a11 - a01) * fx
-    return int(top + (bot - top) * fy)
+# Almond/lens outline from two arcs
+ARC_R = (EYE_WIDTH ** 2 + EYE_HEIGHT ** 2) / (2.0 * EYE_HEIGHT)
+UPPER_CY = EYE_CY + (ARC_R - EYE_HEIGHT)
+LOWER_CY = EYE_CY - (ARC_R - EYE_HEIGHT)
 
+# --- Sparkle (Claude logo) placement ---
+SPARKLE_RADIUS = 7.0  # Radius of the area where the sparkle is drawn
+SPARKLE_LIMIT = SPARKLE_RADIUS + 0.5
 
-def clamp(v: float) -> int:
-    return max(0, min(255, int(v)))
 
+def build_sparkle_lut(src_alpha: np.ndarray) -> np.ndarray:
+    """
+    Sample the sparkle source once per design-space pixel.
 
-def draw_icon(
-    size: int,
-    src_pixels: list[int], src_w: int, src_h: int,
-) -> list[int]:
+    Returns a (DESIGN_SIZE, DESIGN_SIZE) table of 0-255 alphas indexed by
+    integer design coordinates [dy, dx]. Icons whose size divides
+    DESIGN_SIZE land exactly on these coordinates.
     """
-    Draw the Claude Watch icon at the given size.
+    coords = np.arange(DESIGN_SIZE, dtype=float)
+    dx, dy = np.meshgrid(coords, coords)
+    # Map to source image coordinates
+    # Center the source image in the sparkle area
+    src_h, src_w = src_alpha.shape
+    src_x = ((dx - EYE_CX) / SPARKLE_RADIUS * 0.5 + 0.5) * src_w
+    src_y = ((dy - EYE_CY) / SPARKLE_RADIUS * 0.5 + 0.5) * src_h
+    return sample_image_grid(src_alpha, src_x, src_y)
+
+
+def draw_icon_loop(
+    size: int, sparkle_lut: np.ndarray, alpha_out: np.ndarray,
+) -> None:
+    """
+    Per-pixel renderer for the numba backend of draw_icon.
 
-    Design: A rounded eye with Claude's sparkle logo as the pupil.
-    The eye is tall (not too elongated) so the sparkle is clearly visible.
+    Writes the 0-255 icon alpha into a zeroed (size, size) float array.
+    _draw_icon.pyx mirrors this loop, taking the geometry constants as
+    arguments.
     """
-    pixels = [0] * (size * size * 4)
-    scale = size / 32.0  # Normalize to 32px design space
+    scale = size / DESIGN_SIZE
+    inv_scale = 1.0 / scale
+    stroke = 2.0 * scale
+    outer_stroke = 1.2 * scale
+
+    # Nothing is drawn outside this box: the outer edge is limited to
+    # EYE_WIDTH + 2 horizontally, and its distance from the eye grows at
+    # least as fast as |rel_y| - EYE_HEIGHT vertically
+    reject_x = EYE_WIDTH + 2
+    reject_y = EYE_HEIGHT + outer_stroke
+    sparkle_limit_sq = SPARKLE_LIMIT * SPARKLE_LIMIT
+
+    # The eye is the intersection of both arc discs, so the distance that
+    # matters is always the larger of the two. Inside the eye it sets the
+    # stroke, outside it sets the anti-aliased edge; squared thresholds keep
+    # the sqrt off pixels that end up undrawn
+    # Squares are written as products: CPython's ** goes through pow(),
+    # which can round differently from the compiled and NumPy backends
+    arc_r_sq = ARC_R * ARC_R
+    stroke_r = ARC_R - stroke * inv_scale
+    stroke_sq = stroke_r * stroke_r
+    outer_r = ARC_R + outer_stroke
+    outer_sq = outer_r * outer_r
 
-    def set_pixel(x: int, y: int, alpha: int) -> None:
-        if 0 <= x < size and 0 <= y < size:
-            idx = (y * size + x) * 4
-            pixels[idx] = 0
-            pixels[idx + 1] = 0
-            pixels[idx + 2] = 0
-            pixels[idx + 3] = max(pixels[idx + 3], alpha)
+    for py in range(size):
+        # Everything that depends only on the row
+        dy = py * inv_scale
+        rel_y = dy - EYE_CY
+        if abs(rel_y) >= reject_y:
+            continue
+        rel_y_sq = rel_y * rel_y
+        dy_upper = dy - UPPER_CY
+        dy_lower = dy - LOWER_CY
+        dy_upper_sq = dy_upper * dy_upper
+        dy_lower_sq = dy_lower * dy_lower
+        lut_y = int(dy)
 
-    def distance(x1: float, y1: float, x2: float, y2: float) -> float:
-        return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+        for px in range(size):
+            dx = px * inv_scale
+            rel_x = dx - EYE_CX
+            if abs(rel_x) >= reject_x:
+                continue
+            rel_x_sq = rel_x * rel_x
 
-    # --- Eye shape parameters (in 32px design space) ---
-    eye_cx = 16.0
-    eye_cy = 16.0
-    eye_width = 14.0    # Half-width of the eye
-    eye_height = 10.0   # Half-height — tall, rounded eye
+            alpha = 0.0
 
-    # --- Sparkle (Claude logo) placement ---
-    sparkle_radius = 7.0  # Radius of the area where the sparkle is drawn
+            d2 = rel_x_sq + max(dy_upper_sq, dy_lower_sq)
 
-    for py in range(size):
-        for px in range(size):
-            dx = px / scale
-            dy = py / scale
+            if d2 < arc_r_sq:
+                # Inside the eye
+                if rel_x_sq + rel_y_sq < sparkle_limit_sq:
+                    alpha = sparkle_lut[lut_y, int(dx)] * 0.9
+
+                if d2 > stroke_sq:
+                    edge_dist = (ARC_R - math.sqrt(d2)) * scale
+                    if edge_dist < stroke:
+                        alpha = max(alpha, (1.0 - edge_dist / stroke) * 255)
+            elif d2 < outer_sq:
+                # Outside — anti-aliased outer edge
+                out_dist = math.sqrt(d2) - ARC_R
+                if out_dist < outer_stroke:
+                    t = 1.0 - (out_dist / outer_stroke)
+                    alpha = max(alpha, t * 255)
 
-            rel_x = dx - eye_cx
-            rel_y = dy - eye_cy
+            alpha_out[py, px] = alpha
 
-            alpha = 0.0
 
-            # --- Eye outline (almond/lens shape from two arcs) ---
-            arc_r = (eye_width ** 2 + eye_height ** 2) / (2.0 * eye_height)
-            upper_cy = eye_cy + (arc_r - eye_height)
-            lower_cy = eye_cy - (arc_r - eye_height)
+def draw_icon_grid(size: int, sparkle_lut: np.ndarray) -> np.ndarray:
+    """
+    NumPy renderer for draw_icon; the default backend.
 
-            dist_upper = distance(dx, dy, eye_cx, upper_cy)
-            dist_lower = distance(dx, dy, eye_cx, lower_cy)
+    Evaluates every pixel at once over a (size, size) grid and returns the
+    0-255 icon alpha as a float array. Uses the same arithmetic as
+    draw_icon_loop, so both give identical results at every size.
+    """
+    scale = size / DESIGN_SIZE  # Normalize to 32px design space
+    inv_scale = 1.0 / scale
+    stroke = 2.0 * scale
+    outer_stroke = 1.2 * scale
+
+    coords = np.arange(size) * inv_scale
+    dx, dy = np.meshgrid(coords, coords)
+
+    rel_x = dx - EYE_CX
+    rel_y = dy - EYE_CY
+    rel_x_sq = rel_x * rel_x
+
+    # Outside the bounding box nothing is drawn (see draw_icon_loop)
+    in_box = ((np.abs(rel_x) < EYE_WIDTH + 2)
+              & (np.abs(rel_y) < EYE_HEIGHT + outer_stroke))
+
+    alpha = np.zeros((size, size))
+
+    # --- Eye outline (almond/lens shape from two arcs) ---
+    # The larger squared distance to the two arc centres decides both the
+    # inside test and the distance to the outline
+    dy_upper = dy - UPPER_CY
+    dy_lower = dy - LOWER_CY
+    d2 = rel_x_sq + np.maximum(dy_upper * dy_upper, dy_lower * dy_lower)
+    dist = np.sqrt(d2)
+    inside = in_box & (d2 < ARC_R * ARC_R)
+
+    # --- Claude sparkle as pupil ---
+    sparkle = inside & (rel_x_sq + rel_y * rel_y
+                        < SPARKLE_LIMIT * SPARKLE_LIMIT)
+    lut_idx = coords.astype(int)
+    sampled = sparkle_lut[np.ix_(lut_idx, lut_idx)]
+    alpha[sparkle] = sampled[sparkle] * 0.9
+
+    # --- Eye outline stroke ---
+    edge_dist = (ARC_R - dist) * scale
+    stroke_r = ARC_R - stroke * inv_scale
+    outline = inside & (d2 > stroke_r * stroke_r) & (edge_dist < stroke)
+    outline_alpha = (1.0 - edge_dist / stroke) * 255
+    alpha = np.where(outline, np.maximum(alpha, outline_alpha), alpha)
+
+    # Outside — anti-aliased outer edge
+    out_dist = dist - ARC_R
+    outer_r = ARC_R + outer_stroke
+    outer = (in_box & ~inside & (d2 < outer_r * outer_r)
+             & (out_dist < outer_stroke))
+    outer_alpha = (1.0 - out_dist / outer_stroke) * 255
+    return np.where(outer, np.maximum(alpha, outer_alpha), alpha)
+
+
+BACKENDS = ('numpy', 'numba', 'cython')
+
+
+@functools.lru_cache(maxsize=None)
+def load_draw_icon_loop(backend: str) -> Optional[Callable[..., None]]:
+    """
+    Compile the per-pixel renderer for the numba or cython backend.
 
-            inside_upper = dist_upper < arc_r
-            inside_lower = dist_lower < arc_r
+    Returns a draw_icon_loop-compatible function, or None when the backend
+    is not installed or fails to build.
+    """
+    if backend == 'numba':
+        try:
+            from numba import njit
+        except ImportError:  # Numba is optional
+            return None
+        return njit(cache=True)(draw_icon_loop)
+
+    try:
+        import pyximport
+    except ImportError:  # Cython is optional
+        return None
+    pyximport.install(language_level=3)
+    # _draw_icon.pyx sits next to this script, wherever it is run from
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    try:
+        from _draw_icon import draw_icon_loop as draw_icon_loop_c
+    except ImportError:  # Building failed, e.g. no C compiler
+        return None
+
+    def draw_icon_loop_cython(
+        size: int, sparkle_lut: np.ndarray, alpha_out: np.ndarray,
+    ) -> None:
+        draw_icon_loop_c(
+            size, sparkle_lut, alpha_out,
+            DESIGN_SIZE, EYE_CX, EYE_CY, EYE_WIDTH, EYE_HEIGHT,
+            ARC_R, UPPER_CY, LOWER_CY, SPARKLE_LIMIT,
+        )
+
+    return draw_icon_loop_cython
+
+
+def render_alpha(
+    size: int, sparkle_lut: np.ndarray, backend: str = 'numpy',
+) -> np.ndarray:
+    """Render the 0-255 icon alpha as a (size, size) float array."""
+    if backend == 'numpy':
+        return draw_icon_grid(size, sparkle_lut)
+    if backend not in BACKENDS:
+        raise ValueError(f'Unknown backend: {backend}')
+
+    loop = load_draw_icon_loop(backend)
+    if loop is None:
+        raise RuntimeError(f'The {backend} backend is not available')
+    alpha = np.zeros((size, size))
+    loop(size, sparkle_lut, alpha)
+    return alpha
+
+
+def check_backends(sparkle_lut: np.ndarray, max_size: int = 128) -> bool:
+    """
+    Check that every renderer produces the same alpha as the NumPy one.
 
-            edge_upper = arc_r - dist_upper
-            edge_lower = arc_r - dist_lower
+    Compares the plain-Python draw_icon_loop and each compiled backend that
+    is available, exactly, at every size up to max_size. Prints a line per
+    renderer and returns whether all of them matched.
+    """
+    sizes = range(1, max_size + 1)
+    expected = [draw_icon_grid(size, sparkle_lut) for size in sizes]
+    renderers = {'python': draw_icon_loop}
+    for backend in BACKENDS[1:]:
+        loop = load_draw_icon_loop(backend)
+        if loop is None:
+            print(f'{backend}: not available, skipped')
+        else:
+            renderers[backend] = loop
+
+    ok = True
+    for name, loop in renderers.items():
+        mismatched = []
+        for size, want in zip(sizes, expected):
+            alpha = np.zeros((size, size))
+            loop(size, sparkle_lut, alpha)
+            if not np.array_equal(alpha, want):
+                mismatched.append(size)
+        if mismatched:
+            ok = False
+            print(f'{name}: differs from numpy at {len(mismatched)} sizes,'
+                  f' first at {mismatched[0]}')
+        else:
+            print(f'{name}: matches numpy at sizes 1-{max_size}')
+    return ok
 
-            stroke = 2.0 * scale
-            outer_stroke = 1.2 * scale
 
-            if inside_upper and inside_lower:
-                # Inside the eye
-                edge_dist = min(edge_upper, edge_lower) * scale
-
-                # --- Claude sparkle as pupil ---
-                dist_center = distance(dx, dy, eye_cx, eye_cy)
-                if dist_center < sparkle_radius + 0.5:
-                    # Map to source image coordinates
-                    # Center the source image in the sparkle area
-                    src_x = (rel_x / sparkle_radius * 0.5 + 0.5) * src_w
-                    src_y = (rel_y / sparkle_radius * 0.5 + 0.5) * src_h
-                    sampled = sample_image(src_pixels, src_w, src_h, src_x, src_y)
-                    if sampled > 0:
-                        alpha = max(alpha, sampled * 0.9)
-
-                # --- Eye outline stroke ---
-                if edge_dist < stroke:
-                    t = edge_dist / stroke
-                    outline_alpha = (1.0 - t) * 255
-                    alpha = max(alpha, outline_alpha)
-            else:
-                # Outside — anti-aliased outer edge
-                if abs(rel_x) < eye_width + 2:
-                    out_upper = -edge_upper if not inside_upper else 0
-                    out_lower = -edge_lower if not inside_lower else 0
-                    out_dist = max(out_upper, out_lower)
-                    if out_dist < outer_stroke:
-                        t = 1.0 - (out_dist / outer_stroke)
-                        alpha = max(alpha, t * 255)
+def draw_icon(
+    size: int, sparkle_lut: np.ndarray, backend: str = 'numpy',
+) -> np.ndarray:
+    """
+    Draw the Claude Watch icon at the given size.
 
-            if alpha > 0:
-                set_pixel(px, py, clamp(alpha))
+    Design: A rounded eye with Claude's sparkle logo as the pupil.
+    The eye is tall (not too elongated) so the sparkle is clearly visible.
 
+    Returns a (size, size, 4) RGBA array: black, with the shape in alpha.
+    """
+    alpha = render_alpha(size, sparkle_lut, backend)
+    pixels = np.zeros((size, size, 4), np.uint8)
+    pixels[..., 3] = np.clip(alpha, 0, 255).astype(np.uint8)
     return pixels
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+    )
+    parser.add_argument(
+        '--backend', choices=BACKENDS, default='numpy',
+        help='icon renderer (default: numpy)',
+    )
+    parser.add_argument(
+        '--check-backends', action='store_true',
+        help='compare all available renderers instead of writing icons',
+    )
+    args = parser.parse_args()
+
     script_dir = os.path.dirname(os.path.abspath(__file__))
     assets_dir = os.path.join(script_dir, '..', 'assets')
     os.makedirs(assets_dir, exist_ok=True)
 
     # Load Claude sparkle source image
     src_path = os.path.expanduser('~/Downloads/icons8-100.png')
-    src_w, src_h, src_pixels = decode_png(src_path)
+    src_w, src_h, src_alpha = decode_png(src_path)
     print(f'Loaded source: {src_path} ({src_w}x{src_h})')
+    sparkle_lut = build_sparkle_lut(src_alpha)
+
+    if args.check_backends:
+        raise SystemExit(0 if check_backends(sparkle_lut) else 1)
+
+    # Render once at 32x32 (@2x); 16x16 (@1x) is the 2x2 box average of it
+    pixels_32 = draw_icon(32, sparkle_lut, args.backend)
+    pixels_16 = (pixels_32.reshape(16, 2, 16, 2, 4).mean(axis=(1, 3))
+                 .round().astype(np.uint8))
 
-    # Generate 16x16 (@1x)
-    pixels_16 = draw_icon(16, src_pixels, src_w, src_h)
-    png_16 = create_png(16, 16, pixels_16)
+    # Write 16x16 (@1x)
+    png_16 = create_png(pixels_16)
     path_16 = os.path.join(assets_dir, 'IconTemplate.png')
     with open(path_16, 'wb') as f:
         f.write(png_16)
     print(f'Created {path_16} (16x16)')
 
-    # Generate 32x32 (@2x)
-    pixels_32 = draw_icon(32, src_pixels, src_w, src_h)
-    png_32 = create_png(32, 32, pixels_32)
+    # Write 32x32 (@2x)
+    png_32 = create_png(pixels_32)
     path_32 = os.path.join(assets_dir, 'IconTemplate@2x.png')
     with open(path_32, 'wb') as f:
         f.write(png_32)